@@ -3,13 +3,13 @@
 CLI chatbot with persistent conversation history, sentiment analysis, intent classification, and typing effect.
 
 Features:
-- Stores conversation history (last 10 messages in memory)
-- Saves history to a JSON file for persistence
+- Stores conversation history (last 10 messages in memory, older ones summarized)
+- Saves history to a JSON-Lines file for persistence
 - Loads previous conversations on startup
 - Detects sentiment (positive, negative, neutral)
 - Classifies intent (question, greeting, command, statement)
 - Shows sentiment emoji in history
-- Simulates human-like typing animation
+- Simulates human-like typing animation (opt-in via CHATBOT_TYPING=1)
 - Responds contextually based on mood and intent
 - Allows you to view the chat history
 - Supports basic keyword-based responses
@@ -21,9 +21,14 @@ Type 'clear' to start a fresh conversation.
 
 import sys
 import json
+import os
+import re
+import atexit
+import functools
 import random
 import time
-from typing import List, Tuple
+from collections import Counter, deque
+from typing import Deque, FrozenSet, Iterable, List, Optional, TextIO, Tuple
 from pathlib import Path
 
 RESPONSES = {
@@ -35,30 +40,35 @@ RESPONSES = {
     "thank you": "Happy to help!",
 }
 
+# All RESPONSES keywords in one alternation (longest first), matched on word boundaries
+_KEYWORD_RE = re.compile(
+    r"\b(" + "|".join(map(re.escape, sorted(RESPONSES, key=len, reverse=True))) + r")\b"
+)
+
 FALLBACKS = [
     "I'm not sure I understand. Can you rephrase?",
     "Interesting — tell me more.",
     "Hmm, I don't have a good answer for that yet.",
 ]
 
-EXIT_KEYWORDS = {"exit", "quit", "bye", "goodbye"}
+EXIT_KEYWORDS = frozenset({"exit", "quit", "bye", "goodbye"})
 
 
 # ============================================================================
 # Sentiment Analysis
 # ============================================================================
 
-POSITIVE_WORDS = {
+POSITIVE_WORDS = frozenset({
     "good", "great", "awesome", "excellent", "love", "happy", "nice", "wonderful", 
-    "fantastic", "amazing", "brilliant", "perfect", "beautiful", "wonderful", 
+    "fantastic", "amazing", "brilliant", "perfect", "beautiful", 
     "delighted", "thrilled", "excited", "pleased", "glad", "joy", "superb"
-}
+})
 
-NEGATIVE_WORDS = {
+NEGATIVE_WORDS = frozenset({
     "bad", "terrible", "hate", "sad", "angry", "awful", "poor", "disappointed", 
-    "frustrated", "upset", "annoyed", "miserable", "awful", "disgusting", "horrible",
-    "dreadful", "dislike", "worse", "worst", "worst", "pathetic", "useless"
-}
+    "frustrated", "upset", "annoyed", "miserable", "disgusting", "horrible",
+    "dreadful", "dislike", "worse", "worst", "pathetic", "useless"
+})
 
 
 def analyze_sentiment(message: str) -> str:
@@ -66,16 +76,7 @@ def analyze_sentiment(message: str) -> str:
     Analyze sentiment of a message.
     Returns: 'positive', 'negative', or 'neutral'
     """
-    words = message.lower().split()
-    
-    pos_count = sum(1 for word in words if word.strip(".,!?;:") in POSITIVE_WORDS)
-    neg_count = sum(1 for word in words if word.strip(".,!?;:") in NEGATIVE_WORDS)
-    
-    if pos_count > neg_count and pos_count > 0:
-        return "positive"
-    elif neg_count > pos_count and neg_count > 0:
-        return "negative"
-    return "neutral"
+    return analyze(message)[0]
 
 
 def get_sentiment_emoji(sentiment: str) -> str:
@@ -87,9 +88,9 @@ def get_sentiment_emoji(sentiment: str) -> str:
 # Intent Classification
 # ============================================================================
 
-QUESTION_WORDS = {"what", "when", "where", "why", "how", "who", "which", "can", "could", "would", "do", "did", "does"}
-GREETING_WORDS = {"hello", "hi", "hey", "greetings", "welcome", "sup", "yo", "howdy"}
-COMMAND_WORDS = {"history", "clear", "help", "exit", "quit", "bye"}
+QUESTION_WORDS = frozenset({"what", "when", "where", "why", "how", "who", "which", "can", "could", "would", "do", "did", "does"})
+GREETING_WORDS = frozenset({"hello", "hi", "hey", "greetings", "welcome", "sup", "yo", "howdy"})
+COMMAND_WORDS = frozenset({"history", "clear", "help", "exit", "quit", "bye"})
 
 
 def classify_intent(message: str) -> str:
@@ -97,23 +98,7 @@ def classify_intent(message: str) -> str:
     Classify the intent of a message.
     Returns: 'question', 'greeting', 'command', or 'statement'
     """
-    msg_lower = message.lower()
-    words = set(msg_lower.split())
-    
-    # Check for commands first
-    if any(word in COMMAND_WORDS for word in words):
-        return "command"
-    
-    # Check for greetings
-    if any(word in GREETING_WORDS for word in words):
-        return "greeting"
-    
-    # Check for questions (question words or ends with ?)
-    if any(word in QUESTION_WORDS for word in words) or msg_lower.endswith("?"):
-        return "question"
-    
-    # Default to statement
-    return "statement"
+    return analyze(message)[1]
 
 
 def get_intent_emoji(intent: str) -> str:
@@ -121,164 +106,377 @@ def get_intent_emoji(intent: str) -> str:
     return {"question": "❓", "greeting": "👋", "command": "⚙️", "statement": "💬"}.get(intent, "💬")
 
 
+# ============================================================================
+# Message Analysis
+# ============================================================================
+
+# Punctuation becomes a word separator, so "good,great" yields two clean tokens
+_PUNCT = str.maketrans({c: " " for c in ".,!?;:"})
+
+# Indexed by sign(pos_count - neg_count) + 1
+_SENTIMENTS = ("negative", "neutral", "positive")
+
+
+@functools.lru_cache(maxsize=512)
+def analyze(message: str) -> Tuple[str, str, str, FrozenSet[str]]:
+    """
+    Analyze a message in a single pass over its text.
+    Returns: (sentiment, intent, lowercased message, set of punctuation-free words)
+    """
+    msg_lower = message.lower()
+    words = frozenset(msg_lower.translate(_PUNCT).split())
+    
+    # Sentiment (set & walks the smaller operand, so cost tracks message length, not lexicon size)
+    pos_count = len(words & POSITIVE_WORDS)
+    neg_count = len(words & NEGATIVE_WORDS)
+    sentiment = _SENTIMENTS[(pos_count > neg_count) - (neg_count > pos_count) + 1]
+    
+    # Intent: commands first, then greetings, then questions (question words or ends with ?)
+    if words & COMMAND_WORDS:
+        intent = "command"
+    elif words & GREETING_WORDS:
+        intent = "greeting"
+    elif words & QUESTION_WORDS or msg_lower.endswith("?"):
+        intent = "question"
+    else:
+        intent = "statement"
+    
+    return sentiment, intent, msg_lower, words
+
+
 # ============================================================================
 # Typing Effect
 # ============================================================================
 
+_TYPING_ENABLED = os.environ.get("CHATBOT_TYPING") == "1"
+_TYPING_CHUNK = 4  # characters written per flush/sleep
+
+
 def typing_effect(text: str, speed: float = 0.03) -> None:
     """
     Display text with a typing animation effect.
     
+    The animation is opt-in via CHATBOT_TYPING=1; otherwise the text is
+    written in one go.
+    
     Args:
         text: The text to display
         speed: Delay between characters in seconds (default: 0.03)
     """
-    for char in text:
-        print(char, end='', flush=True)
-        time.sleep(speed)
-    print()  # New line at the end
-
-
-RESPONSES = {
-    "hello": "Hello! How can I help you today?",
-    "hi": "Hi there! What would you like to talk about?",
-    "help": "I can chat with you and remember our conversation. Type 'history' to see what we've talked about, or just keep chatting!",
-    "bye": "Goodbye! Have a great day!",
-    "thanks": "You're welcome!",
-    "thank you": "Happy to help!",
-}
-
-FALLBACKS = [
-    "I'm not sure I understand. Can you rephrase?",
-    "Interesting — tell me more.",
-    "Hmm, I don't have a good answer for that yet.",
-]
-
-EXIT_KEYWORDS = {"exit", "quit", "bye", "goodbye"}
+    # Bound per call so the loop skips attribute lookups but still follows sys.stdout
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    
+    if not _TYPING_ENABLED:
+        write(text + "\n")
+        return
+    
+    for i in range(0, len(text), _TYPING_CHUNK):
+        write(text[i:i + _TYPING_CHUNK])
+        flush()
+        time.sleep(speed * _TYPING_CHUNK)
+    write("\n")  # New line at the end
 
 
 class ConversationHistory:
-    """Store and retrieve conversation messages with file persistence and sentiment."""
+    """Store and retrieve conversation messages with file persistence and sentiment.
+
+    Only the last max_size messages are kept verbatim; older ones are folded into
+    a one-line rolling `summary`.
+    """
     
-    def __init__(self, max_size: int = 10, history_file: str = "chat_history.json"):
-        self.messages: List[Tuple[str, str, str]] = []  # (speaker, text, sentiment)
+    def __init__(self, max_size: int = 10, history_file: str = "chat_history.jsonl", save_every: int = 10):
+        self.messages: Deque[Tuple[str, str, str]] = deque(maxlen=max_size)  # (speaker, text, sentiment)
         self.max_size = max_size
         self.history_file = Path(history_file)
+        self.summary = ""  # rolling summary of messages evicted from the window
+        self._summary_counts: Counter = Counter()  # "messages" plus user sentiment tallies
+        self._fh: Optional[TextIO] = None  # append handle, opened on first save
+        self._pending: List[str] = []  # encoded lines not yet written to disk
+        self._display_cache: Optional[str] = None  # rendered display(), reset on change
+        self._loaded_mtime: Optional[int] = None  # st_mtime_ns of the file as last loaded
+        self._save_every = save_every
         self.load_from_file()
     
     def load_from_file(self) -> None:
-        """Load conversation history from JSON file."""
-        if self.history_file.exists():
+        """Load the last max_size messages from the JSON-Lines history file.
+
+        Skips parsing when the file is missing, empty, or unchanged since the last load.
+        """
+        # Flush first so a reload never discards messages that only exist in memory
+        self.save_to_file()
+        if not self.history_file.exists():
+            self._import_legacy_json()
+            return
+        stat = self.history_file.stat()
+        if stat.st_size == 0 or stat.st_mtime_ns == self._loaded_mtime:
+            return
+        try:
+            # errors="replace" confines invalid UTF-8 to the line it appears on
+            with open(self.history_file, "r", encoding="utf-8", errors="replace") as f:
+                lines = f.readlines()
+            # Start from the file's own summary so a reload never double-counts
+            self._summary_counts = Counter()
+            self.summary = ""
+            skipped = False
+            # A summary header is only ever written as the first line, by rewrite_file()
+            if lines and lines[0].startswith("{"):
+                header = self._decode_summary(lines.pop(0))
+                if header is None:
+                    skipped = True
+                else:
+                    self._summary_counts, self.summary = header
+            # Decode line by line so one torn or corrupt line only loses itself
+            messages = []
+            for line in lines:
+                try:
+                    messages.append(self._decode(line))
+                except (ValueError, TypeError, IndexError):
+                    skipped = True
+            if self._restore(messages) or skipped:
+                self.rewrite_file()
+            self._loaded_mtime = self.history_file.stat().st_mtime_ns
+        except (ValueError, OSError):
+            self.messages.clear()
+            self._summary_counts.clear()
+            self.summary = ""
+        self._display_cache = None
+    
+    def _import_legacy_json(self) -> None:
+        """One-time import of a pre-JSON-Lines history file (e.g. chat_history.json)."""
+        legacy_file = self.history_file.with_suffix(".json")
+        if legacy_file == self.history_file or not legacy_file.is_file():
+            return
+        try:
+            with open(legacy_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (ValueError, OSError):
+            return
+        if not isinstance(data, list):
+            return
+        self._summary_counts = Counter()
+        self.summary = ""
+        messages = []
+        for msg in data:
             try:
-                with open(self.history_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    # Convert to tuples and keep only the last max_size messages
-                    self.messages = [tuple(msg) if len(msg) == 3 else (msg[0], msg[1], "neutral") 
-                                    for msg in data[-self.max_size:]]
-            except (json.JSONDecodeError, IOError):
-                self.messages = []
+                messages.append(self._from_json(msg))
+            except (ValueError, TypeError, IndexError):
+                pass
+        self._restore(messages)
+        self.rewrite_file()
+        self._display_cache = None
+    
+    def _restore(self, messages: List[Tuple[str, str, str]]) -> bool:
+        """Keep the last max_size messages and summarize the rest; True if any were older."""
+        split = max(len(messages) - self.max_size, 0)
+        self.messages = deque(messages[split:], maxlen=self.max_size)
+        self.summary = self._summarize(messages[:split])
+        return split > 0
+    
+    @staticmethod
+    def _encode(message: Tuple[str, str, str]) -> str:
+        """Encode one message as a compact JSON line."""
+        return json.dumps(message, separators=(",", ":")) + "\n"
+    
+    @staticmethod
+    def _from_json(msg: list) -> Tuple[str, str, str]:
+        """Build a message tuple, sharing a single str object per speaker/sentiment label."""
+        if not isinstance(msg, list) or not isinstance(msg[1], str):
+            raise ValueError(f"not a history message: {msg!r}")
+        sentiment = sys.intern(msg[2]) if len(msg) == 3 else "neutral"
+        return sys.intern(msg[0]), msg[1], sentiment
+    
+    @staticmethod
+    def _decode_summary(line: str) -> Optional[Tuple[Counter, str]]:
+        """Decode a summary header line into (tallies, summary text); None if malformed."""
+        try:
+            header = json.loads(line)
+        except ValueError:
+            return None
+        if not isinstance(header, dict):
+            return None
+        counts, summary = header.get("counts", {}), header.get("summary", "")
+        if not isinstance(counts, dict) or not isinstance(summary, str):
+            return None
+        if not all(isinstance(v, int) for v in counts.values()):
+            return None
+        return Counter(counts), summary
+    
+    @classmethod
+    def _decode(cls, line: str) -> Tuple[str, str, str]:
+        """Decode one JSON line into a message tuple."""
+        return cls._from_json(json.loads(line))
+    
+    def _summarize(self, evicted: Iterable[Tuple[str, str, str]]) -> str:
+        """Fold messages evicted from the window into the rolling summary and return it.
+
+        Override to produce a different summary; the default tallies user sentiment.
+        `summary` (the previous result) and `_summary_counts` are both persisted.
+        """
+        counts = self._summary_counts
+        for speaker, _, sentiment in evicted:
+            counts["messages"] += 1
+            if speaker == "user":
+                counts[sentiment] += 1
+        if not counts["messages"]:
+            return ""
+        moods = ", ".join(f"{counts[s]} {s}" for s in ("positive", "negative", "neutral") if counts[s])
+        return f"Earlier: {counts['messages']} messages ({moods or 'none'} from you)"
+    
+    def rewrite_file(self) -> None:
+        """Atomically replace the history file with the messages currently in memory.
+
+        Only these full rewrites are atomic; a crash during save_to_file() can still
+        leave a torn last line, which load_from_file() skips and then compacts away.
+        """
+        tmp_file = self.history_file.with_suffix(".jsonl.tmp")
+        try:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                if self._summary_counts or self.summary:
+                    header = {"summary": self.summary, "counts": self._summary_counts}
+                    f.write(json.dumps(header, separators=(",", ":")) + "\n")
+                f.write("".join(map(self._encode, self.messages)))
+                f.flush()
+                os.fsync(f.fileno())  # data must be on disk before the rename
+            os.replace(tmp_file, self.history_file)
+            self._pending.clear()
+        except IOError as e:
+            print(f"Warning: Could not save history: {e}")
+            tmp_file.unlink(missing_ok=True)
     
     def save_to_file(self) -> None:
-        """Save conversation history to JSON file."""
+        """Append pending messages to the history file in a single write."""
+        if not self._pending:
+            return
         try:
-            with open(self.history_file, "w", encoding="utf-8") as f:
-                json.dump(self.messages, f, indent=2, ensure_ascii=False)
+            if self._fh is None:
+                self._fh = open(self.history_file, "a", encoding="utf-8")
+                # Never append onto an unterminated line left by an interrupted write
+                if self._fh.tell() and not self._ends_with_newline():
+                    self._fh.write("\n")
+            self._fh.write("".join(self._pending))
+            self._fh.flush()
+            self._pending.clear()
         except IOError as e:
             print(f"Warning: Could not save history: {e}")
     
+    def _ends_with_newline(self) -> bool:
+        """Return True if the history file's last byte is a newline."""
+        with open(self.history_file, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    
     def add(self, speaker: str, text: str, sentiment: str = "neutral") -> None:
-        """Add a message to history with sentiment and save."""
-        self.messages.append((speaker, text, sentiment))
-        if len(self.messages) > self.max_size:
-            self.messages.pop(0)
-        self.save_to_file()
+        """Add a message to history; appends to disk every `save_every` messages."""
+        if len(self.messages) == self.max_size and self.messages:
+            self.summary = self._summarize((self.messages[0],))
+        self.messages.append((speaker, text, sentiment))  # deque evicts the oldest when full
+        self._display_cache = None
+        self._pending.append(self._encode((speaker, text, sentiment)))
+        if len(self._pending) >= self._save_every:
+            self.save_to_file()
     
     def display(self) -> str:
         """Return formatted history for display with sentiment emojis."""
+        if self._display_cache is not None:
+            return self._display_cache
+        
         if not self.messages:
             return "No conversation history yet."
         
         lines = ["📝 Conversation History:"]
+        if self.summary:
+            lines.append(f"  🗂️ {self.summary}")
         for speaker, text, sentiment in self.messages:
             emoji = get_sentiment_emoji(sentiment)
             prefix = "You" if speaker == "user" else "Bot"
             lines.append(f"  {emoji} {prefix}: {text}")
-        return "\n".join(lines)
+        self._display_cache = "\n".join(lines)
+        return self._display_cache
     
     def clear(self) -> None:
-        """Clear all history."""
-        self.messages = []
-        self.save_to_file()
+        """Clear all history and empty the history file."""
+        self.messages.clear()
+        self._summary_counts.clear()
+        self.summary = ""
+        self._display_cache = None
+        self.rewrite_file()
+
+
+# Bound once so get_response skips the module attribute lookup on every reply
+_choice = random.choice
+
+_Q_RESPONSES = (
+    "That's a great question! Let me think...",
+    "Good question! I'm not sure I have a perfect answer, but here's what I think...",
+    "I'm glad you asked that.",
+    "That's something to consider.",
+)
+
+_GREET_RESPONSES = (
+    "Hello! Great to see you!",
+    "Hi there! How are you doing?",
+    "Hey! What's on your mind?",
+    "Greetings! What can I help with?",
+)
+
+_POS_RESPONSES = (
+    "That's wonderful to hear!",
+    "I'm glad you're excited!",
+    "That sounds amazing!",
+    "That's great! Tell me more.",
+)
+
+_NEG_RESPONSES = (
+    "I'm sorry to hear that. That sounds frustrating.",
+    "I understand. That must be difficult.",
+    "I feel for you. Is there anything I can help with?",
+    "That's tough. I'm here to listen.",
+)
+
+_STMT_RESPONSES = (
+    "That's interesting! Tell me more.",
+    "I see. Can you elaborate?",
+    "That makes sense.",
+    "Interesting perspective.",
+)
+
+# (intent, sentiment) -> candidate replies; "*" matches any sentiment
+_DISPATCH = {
+    ("question", "*"): _Q_RESPONSES,
+    ("greeting", "*"): _GREET_RESPONSES,
+    ("statement", "positive"): _POS_RESPONSES,
+    ("statement", "negative"): _NEG_RESPONSES,
+    ("statement", "neutral"): _STMT_RESPONSES,
+}
 
 
-def get_response(message: str, sentiment: str, intent: str) -> str:
-    """Return a response based on keyword matching, sentiment, and intent."""
-    if not message.strip():
-        return "Say something so I can respond!"
+def get_response(msg_lower: str, sentiment: str, intent: str) -> str:
+    """Return a response based on keyword matching, sentiment, and intent.
 
-    msg = message.lower()
+    `msg_lower` is the lowercased message, as returned by `analyze`.
+    """
+    if not msg_lower.strip():
+        return "Say something so I can respond!"
     
     # Check for keyword matches
-    for keyword, response in RESPONSES.items():
-        if keyword in msg:
-            return response
-    
-    # Intent-aware responses
-    if intent == "question":
-        question_responses = [
-            "That's a great question! Let me think...",
-            "Good question! I'm not sure I have a perfect answer, but here's what I think...",
-            "I'm glad you asked that.",
-            "That's something to consider.",
-        ]
-        return random.choice(question_responses)
-    
-    if intent == "greeting":
-        greeting_responses = [
-            "Hello! Great to see you!",
-            "Hi there! How are you doing?",
-            "Hey! What's on your mind?",
-            "Greetings! What can I help with?",
-        ]
-        return random.choice(greeting_responses)
+    match = _KEYWORD_RE.search(msg_lower)
+    if match:
+        return RESPONSES[match.group(1)]
     
-    if intent == "statement":
-        # Combine sentiment + statement
-        if sentiment == "positive":
-            pos_responses = [
-                "That's wonderful to hear!",
-                "I'm glad you're excited!",
-                "That sounds amazing!",
-                "That's great! Tell me more.",
-            ]
-            return random.choice(pos_responses)
-        
-        if sentiment == "negative":
-            neg_responses = [
-                "I'm sorry to hear that. That sounds frustrating.",
-                "I understand. That must be difficult.",
-                "I feel for you. Is there anything I can help with?",
-                "That's tough. I'm here to listen.",
-            ]
-            return random.choice(neg_responses)
-        
-        # Neutral statement
-        statement_responses = [
-            "That's interesting! Tell me more.",
-            "I see. Can you elaborate?",
-            "That makes sense.",
-            "Interesting perspective.",
-        ]
-        return random.choice(statement_responses)
-    
-    # Fallback for any other intent
-    return random.choice(FALLBACKS)
+    # Intent-aware responses; only statements are further split by sentiment
+    key = (intent, sentiment if intent == "statement" else "*")
+    return _choice(_DISPATCH.get(key, FALLBACKS))
 
 
 def main() -> None:
     print("Chatbot with Sentiment & Intent Analysis — type 'history' to see your chat, 'clear' to reset, or 'exit' to leave\n")
     
     history = ConversationHistory()
+    atexit.register(history.save_to_file)
     
     try:
         while True:
@@ -290,45 +488,44 @@ def main() -> None:
                 print()
                 continue
             
+            # Analyze sentiment and intent once per message
+            sentiment, intent, msg_lower, _ = analyze(user_input)
+            
             # Check for exit
-            if user_input.lower() in EXIT_KEYWORDS:
+            if msg_lower in EXIT_KEYWORDS:
+                history.save_to_file()
                 print("Bot: ", end='')
-                typing_effect("Goodbye! (History saved to chat_history.json)")
+                typing_effect("Goodbye! (History saved to chat_history.jsonl)")
                 print()
                 break
             
-            # Check for history command
-            if user_input.lower() == "history":
+            # Check for history command (not itself recorded, so repeat views hit the cache)
+            if msg_lower == "history":
                 print(f"Bot: {history.display()}\n")
-                sentiment = analyze_sentiment(user_input)
-                history.add("user", user_input, sentiment)
                 continue
             
             # Check for clear command
-            if user_input.lower() == "clear":
+            if msg_lower == "clear":
                 history.clear()
                 print("Bot: ", end='')
                 typing_effect("Conversation history cleared!")
                 print()
                 continue
             
-            # Analyze sentiment and classify intent
-            sentiment = analyze_sentiment(user_input)
-            intent = classify_intent(user_input)
-            
             # Record user message with sentiment
             history.add("user", user_input, sentiment)
             
             # Generate and display response with typing effect
-            response = get_response(user_input, sentiment, intent)
+            response = get_response(msg_lower, sentiment, intent)
             history.add("bot", response, "neutral")
             print("Bot: ", end='')
             typing_effect(response)
             print()
     
     except (KeyboardInterrupt, EOFError):
+        history.save_to_file()
         print("\nBot: ", end='')
-        typing_effect("Goodbye! (History saved to chat_history.json)")
+        typing_effect("Goodbye! (History saved to chat_history.jsonl)")
         print()
         sys.exit(0)
 